@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+from tsdownsample import LTTBDownsampler
+
+
+def lttb_downsample(
+    frame: pd.DataFrame, column: str, max_points: int | None
+) -> pd.DataFrame:
+    """Keep at most max_points rows, preserving the visual shape of a column."""
+    if max_points is None or len(frame) <= max_points:
+        return frame
+
+    # asi8 also covers tz-aware indexes, whose to_numpy() is an object array
+    if pd.api.types.is_datetime64_any_dtype(frame.index):
+        x_values = frame.index.asi8
+    else:
+        x_values = frame.index.to_numpy()
+
+    indices = LTTBDownsampler().downsample(
+        x_values, frame[column].to_numpy(), n_out=max_points
+    )
+    return frame.iloc[indices]
+
+
+def forecast_frame(
+    index: pd.Index,
+    expected_values: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+) -> pd.DataFrame:
+    """Wrap forecast arrays in a frame without copying them or the series."""
+    return pd.DataFrame(
+        {"expected": expected_values, "upper": upper, "lower": lower},
+        index=index,
+        copy=False,
+    )
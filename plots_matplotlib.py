@@ -1,10 +1,51 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Iterable
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
 import pandas as pd
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+
+from downsampling import forecast_frame, lttb_downsample
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
+
+@lru_cache(maxsize=None)
+def _get_plt():
+    """Import pyplot on first use, it is slow to load."""
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+@lru_cache(maxsize=None)
+def _get_seaborn_style() -> dict:
+    """Import seaborn on first use and resolve its whitegrid style."""
+    import seaborn as sns
+
+    return sns.axes_style("whitegrid")
+
+
+def _get_figure(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return a cleared figure of the given size, reused between calls.
+
+    The returned figure is shared by every call with the same size, so it must
+    not be drawn on from several threads at once.
+    """
+    plt = _get_plt()
+    # pyplot reuses the open figure with this label and makes a new one once
+    # it has been closed (e.g. after plt.show), so it is always displayed
+    fig = plt.figure(num=f"time_series_{figsize}", figsize=figsize, clear=True)
+    # Drop margins left by an earlier tight_layout on this figure
+    fig.subplots_adjust(
+        **{
+            param: plt.rcParams[f"figure.subplot.{param}"]
+            for param in ("left", "right", "bottom", "top", "wspace", "hspace")
+        }
+    )
+    return fig, fig.add_subplot()
 
 
 def add_line(
@@ -31,19 +72,31 @@ def update_layout(ax: Axes, fig: Figure):
     # Enable grid for better readability
     ax.grid(True, alpha=0.3)
 
-    # Format x-axis for dates if the index contains datetime
-    if hasattr(ax.get_xaxis(), "set_major_formatter"):
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+    # Rotate date labels only if the plotted x data is datetime
+    if ax.lines and pd.api.types.is_datetime64_any_dtype(
+        ax.lines[0].get_xdata(orig=True)
+    ):
+        _get_plt().setp(ax.xaxis.get_majorticklabels(), rotation=45)
 
-    # Tight layout to prevent label cutoff
-    fig.tight_layout()
+        # Tight layout to prevent rotated label cutoff
+        fig.tight_layout()
 
     return ax
 
 
-def plot_time_series(time_series: pd.DataFrame, title: str = "Time Series"):
-    """Create a basic time series plot."""
-    fig, ax = plt.subplots(figsize=(20, 8))
+def plot_time_series(
+    time_series: pd.DataFrame,
+    title: str = "Time Series",
+    max_points: int | None = 2000,
+):
+    """Create a basic time series plot.
+
+    The figure is reused by the next call, which clears the returned axes.
+    """
+    fig, ax = _get_figure((20, 8))
+
+    # Downsample long series, there are far fewer pixels than points
+    time_series = lttb_downsample(time_series, "value_0", max_points)
 
     # Add the main time series line
     add_line(ax, time_series.index, time_series["value_0"], title, "blue")
@@ -54,14 +107,23 @@ def plot_time_series(time_series: pd.DataFrame, title: str = "Time Series"):
     return ax
 
 
-def add_confidence_interval(ax: Axes, forecast: pd.DataFrame):
+def add_confidence_interval(
+    ax: Axes, forecast: pd.DataFrame, max_points: int | None = 2000
+):
     """Add forecast line with confidence interval."""
+    # Same rows for all three columns so the band stays aligned
+    forecast = lttb_downsample(forecast, "expected", max_points)
     ds = forecast.index
 
+    # Single precision is plenty for drawing and halves the path data
+    expected = forecast["expected"].to_numpy(dtype=np.float32, copy=False)
+    upper = forecast["upper"].to_numpy(dtype=np.float32, copy=False)
+    lower = forecast["lower"].to_numpy(dtype=np.float32, copy=False)
+
     # Add forecast line
     ax.plot(
         ds,
-        forecast["expected"],
+        expected,
         color=(31 / 255, 119 / 255, 180 / 255, 0.8),
         label="Forecast",
         linewidth=2,
@@ -70,8 +132,8 @@ def add_confidence_interval(ax: Axes, forecast: pd.DataFrame):
     # Add confidence interval as filled area
     ax.fill_between(
         ds,
-        forecast["lower"],
-        forecast["upper"],
+        lower,
+        upper,
         color=(31 / 255, 119 / 255, 180 / 255),
         alpha=0.2,
         label="Confidence Interval",
@@ -103,53 +165,55 @@ def add_anomalies(
     ax: Axes,
     time_series: pd.DataFrame,
     is_anomaly: np.ndarray,
-    expected_values: np.array,
-    expected_bounds: np.array,
+    expected_values: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
 ):
     """Add anomaly points with confidence intervals."""
-    time_series = time_series.copy()
-    time_series["expected"] = expected_values
-    time_series["upper"] = expected_bounds[:, 0]
-    time_series["lower"] = expected_bounds[:, 1]
-
     # Filter anomaly points
-    anomaly_points = time_series[is_anomaly == 1]
+    anomaly_idx = np.flatnonzero(np.asarray(is_anomaly) == 1)
 
     # Add anomaly points
     ax = add_points(
-        ax, anomaly_points.index, anomaly_points["value_0"], "Anomalies", "red"
+        ax,
+        time_series.index.values[anomaly_idx],
+        time_series["value_0"].to_numpy()[anomaly_idx],
+        "Anomalies",
+        "red",
     )
 
     # Add confidence interval
-    ax = add_confidence_interval(ax, time_series)
+    forecast = forecast_frame(time_series.index, expected_values, upper, lower)
+    ax = add_confidence_interval(ax, forecast)
 
     return ax
 
 
 def create_seaborn_time_series(time_series: pd.DataFrame, title: str = "Time Series"):
-    """Create a time series plot using seaborn style."""
-    # Set seaborn style
-    sns.set_style("whitegrid")
-
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    # Use seaborn lineplot
-    sns.lineplot(
-        data=time_series.reset_index(),
-        x=time_series.index.name or "index",
-        y="value_0",
-        ax=ax,
-        color="blue",
-        linewidth=2,
-    )
+    """Create a time series plot using seaborn style.
+
+    The figure is reused by the next call, which clears the returned axes.
+    """
+    # Apply the seaborn style to this plot only, leaving global rcParams alone
+    plt = _get_plt()
+    with plt.rc_context(_get_seaborn_style()):
+        fig, ax = _get_figure((12, 8))
+
+        # Plain matplotlib line, seaborn's data wrangling is not needed here
+        ax.plot(
+            time_series.index.values,
+            time_series["value_0"].to_numpy(),
+            color="blue",
+            linewidth=2,
+        )
 
-    ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.set_xlabel("Time", fontsize=12)
-    ax.set_ylabel("Value", fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        ax.set_xlabel("Time", fontsize=12)
+        ax.set_ylabel("Value", fontsize=12)
 
-    # Rotate x-axis labels for better readability
-    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-    fig.tight_layout()
+        # Rotate x-axis labels for better readability
+        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        fig.tight_layout()
 
     return fig, ax
 
@@ -159,10 +223,9 @@ def add_seaborn_confidence_interval(ax: Axes, forecast: pd.DataFrame):
     ds = forecast.index
 
     # Main forecast line
-    sns.lineplot(
-        x=ds,
-        y=forecast["expected"],
-        ax=ax,
+    ax.plot(
+        ds,
+        forecast["expected"].to_numpy(),
         color="steelblue",
         linewidth=2,
         label="Forecast",
@@ -177,6 +240,7 @@ def add_seaborn_confidence_interval(ax: Axes, forecast: pd.DataFrame):
         color="steelblue",
         label="Confidence Interval",
     )
+    ax.legend()
 
     return ax
 
@@ -185,31 +249,28 @@ def add_seaborn_anomalies(
     ax: Axes,
     time_series: pd.DataFrame,
     is_anomaly: np.ndarray,
-    expected_values: np.array,
-    expected_bounds: np.array,
+    expected_values: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
 ):
     """Add anomalies using seaborn style."""
-    time_series = time_series.copy()
-    time_series["expected"] = expected_values
-    time_series["upper"] = expected_bounds[:, 0]
-    time_series["lower"] = expected_bounds[:, 1]
-
     # Filter anomaly points
-    anomaly_points = time_series[is_anomaly == 1]
-
-    # Add anomaly points using seaborn
-    if not anomaly_points.empty:
-        sns.scatterplot(
-            x=anomaly_points.index,
-            y=anomaly_points["value_0"],
-            ax=ax,
+    anomaly_idx = np.flatnonzero(np.asarray(is_anomaly) == 1)
+
+    # Add anomaly points, white edges as in sns.scatterplot
+    if anomaly_idx.size:
+        ax.scatter(
+            time_series.index.values[anomaly_idx],
+            time_series["value_0"].to_numpy()[anomaly_idx],
             color="red",
+            edgecolor="white",
             s=100,
             label="Anomalies",
             zorder=5,
         )
 
     # Add confidence interval
-    ax = add_seaborn_confidence_interval(ax, time_series)
+    forecast = forecast_frame(time_series.index, expected_values, upper, lower)
+    ax = add_seaborn_confidence_interval(ax, forecast)
 
     return ax
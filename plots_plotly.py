@@ -1,8 +1,32 @@
 import plotly.graph_objects as go
+from plotly_resampler import FigureResampler, FigureWidgetResampler
 from typing import Iterable
 import pandas as pd
 import numpy as np
 
+from downsampling import forecast_frame, lttb_downsample
+
+_LAYOUT = dict(
+    title="Time Series",
+    xaxis_title="Time",
+    yaxis_title="Value",
+    height=600,
+    hovermode="x unified",
+    showlegend=True,
+    xaxis=dict(
+        rangeselector=dict(
+            buttons=[
+                dict(count=1, label="day", step="day", stepmode="backward"),
+                dict(count=7, label="week", step="day", stepmode="backward"),
+                dict(count=1, label="month", step="month", stepmode="backward"),
+                dict(step="all"),
+            ]
+        ),
+        type="date",
+    ),
+    yaxis={"fixedrange": False},
+)
+
 
 def add_line(
     fig: go.Figure,
@@ -11,7 +35,13 @@ def add_line(
     name: str,
     color: str,
 ) -> go.Figure:
-    trace = go.Scatter(
+    if isinstance(fig, (FigureResampler, FigureWidgetResampler)):
+        # Keep the full series server-side, only the aggregated view is sent
+        trace = go.Scattergl(mode="lines", name=name, line={"color": color})
+        fig.add_trace(trace, hf_x=x_values, hf_y=y_values)
+        return fig
+
+    trace = go.Scattergl(
         x=x_values,
         y=y_values,
         mode="lines",
@@ -22,74 +52,115 @@ def add_line(
     return fig
 
 
-def update_layout(fig: go.Figure):
-    fig.update_layout(
-        title="Time Series",
-        xaxis_title="Time",
-        yaxis_title="Value",
-        height=600,
-        hovermode="x unified",
-        showlegend=True,
-        xaxis=dict(
-            rangeselector=dict(
-                buttons=[
-                    dict(count=1, label="day", step="day", stepmode="backward"),
-                    dict(count=7, label="week", step="day", stepmode="backward"),
-                    dict(count=1, label="month", step="month", stepmode="backward"),
-                    dict(step="all"),
-                ]
-            ),
-            rangeslider={"visible": True},
-            type="date",
-        ),
-        yaxis={"fixedrange": False},
-    )
+def update_layout(fig: go.Figure, rangeslider: bool = False):
+    fig.update_layout(**_LAYOUT, xaxis_rangeslider_visible=rangeslider)
     return fig
 
 
-def plot_time_series(time_series: pd.DataFrame, title: str = "Time Series"):
-    fig = go.Figure()
+def plot_time_series(
+    time_series: pd.DataFrame,
+    title: str = "Time Series",
+    max_points: int | None = 2000,
+):
+    if max_points is None:
+        fig = go.Figure()
+    else:
+        # Use fig.show_dash() to re-aggregate the visible range on zoom
+        fig = FigureResampler(go.Figure(), default_n_shown_samples=max_points)
     add_line(fig, time_series.index, time_series["value_0"], title, "blue")
     update_layout(fig)
     return fig
 
 
-def add_confidence_interval(fig: go.Figure, forecast: pd.DataFrame):
-    ds = forecast.index
-    fig.add_trace(
-        go.Scatter(
-            x=ds,
-            y=forecast["expected"],
-            mode="lines",
-            name="Forecast",
-            line=dict(color="rgba(31, 119, 180, 0.8)"),
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=ds,
-            y=forecast["upper"],
-            mode="lines",
-            name="Upper Bound",
-            line=dict(width=0),
-            showlegend=False,
-        )
+def update_time_series(fig: go.Figure, time_series: pd.DataFrame):
+    # Assumes trace 0 is the main series, as added by plot_time_series
+    if isinstance(fig, (FigureResampler, FigureWidgetResampler)):
+        # The shown trace is an aggregate, replace the data it is built from
+        hf_trace = fig.hf_data[0]
+        hf_trace["x"] = time_series.index
+        hf_trace["y"] = time_series["value_0"].to_numpy()
+        if isinstance(fig, FigureWidgetResampler):
+            fig.reload_data()
+            return fig
+        # A FigureResampler only re-aggregates in show_dash callbacks, so
+        # refresh the shown trace here for fig.show() and notebook output.
+        # Plain LTTB only approximates the resampler's own aggregator, and the
+        # "~N" suffix in the trace name stays stale until the next relayout.
+        time_series = lttb_downsample(time_series, "value_0", hf_trace["max_n_samples"])
+
+    # Only the two arrays are sent, layout is left untouched
+    with fig.batch_update():
+        fig.data[0].x = time_series.index
+        fig.data[0].y = time_series["value_0"].to_numpy()
+    return fig
+
+
+def _add_traces_with_forecast(
+    fig: go.Figure,
+    forecast: pd.DataFrame,
+    max_points: int | None = 2000,
+    traces: list | None = None,
+) -> go.Figure:
+    traces = list(traces or [])
+    resampled = isinstance(fig, (FigureResampler, FigureWidgetResampler))
+    # Same rows for all columns so the band polygon stays closed and aligned
+    shown = lttb_downsample(forecast, "expected", max_points)
+    # Single precision is plenty for drawing and halves the bytes sent
+    upper = shown["upper"].to_numpy(dtype=np.float32, copy=False)
+    lower = shown["lower"].to_numpy(dtype=np.float32, copy=False)
+
+    # On resampler figures the full forecast is re-aggregated on zoom like
+    # the series, so it gets the raw data instead of the downsampled rows
+    line_data = forecast if resampled else shown
+    line = go.Scattergl(
+        x=line_data.index,
+        y=line_data["expected"].to_numpy(dtype=np.float32, copy=False),
+        mode="lines",
+        name="Forecast",
+        line=dict(color="rgba(31, 119, 180, 0.8)"),
     )
-    fig.add_trace(
-        go.Scatter(
-            x=ds,
-            y=forecast["lower"],
-            mode="lines",
-            name="Lower Bound",
-            fill="tonexty",
-            fillcolor="rgba(31, 119, 180, 0.2)",
-            line=dict(width=0),
-            showlegend=False,
-        )
+
+    # One closed polygon: upper bound forward, lower bound backward
+    band = go.Scattergl(
+        x=shown.index.append(shown.index[::-1]),
+        y=np.concatenate([upper, lower[::-1]]),
+        mode="lines",
+        name="Confidence Interval",
+        fill="toself",
+        fillcolor="rgba(31, 119, 180, 0.2)",
+        line=dict(width=0),
+        hoverinfo="skip",
     )
+
+    if not resampled:
+        fig.add_traces([*traces, line, band])
+        return fig
+
+    # None gives the forecast the figure's default sample count, the other
+    # traces keep their size since aggregating the polygon breaks its outline
+    max_n_samples = [len(trace.x) for trace in traces] + [None, len(band.x)]
+    fig.add_traces([*traces, line, band], max_n_samples=max_n_samples)
     return fig
 
 
+def add_confidence_interval(
+    fig: go.Figure, forecast: pd.DataFrame, max_points: int | None = 2000
+):
+    return _add_traces_with_forecast(fig, forecast, max_points)
+
+
+def _points_trace(
+    x_values: Iterable, y_values: Iterable, name: str, color: str
+) -> go.Scattergl:
+    return go.Scattergl(
+        x=x_values,
+        y=y_values,
+        mode="markers",
+        name=name,
+        marker=dict(color=color, size=10),
+    )
+
+
 def add_points(
     fig: go.Figure,
     x_values: Iterable,
@@ -97,15 +168,7 @@ def add_points(
     name: str = "Anomalies",
     color: str = "red",
 ):
-    fig.add_trace(
-        go.Scatter(
-            x=x_values,
-            y=y_values,
-            mode="markers",
-            name=name,
-            marker=dict(color=color, size=10),
-        )
-    )
+    fig.add_trace(_points_trace(x_values, y_values, name, color))
     return fig
 
 
@@ -113,16 +176,20 @@ def add_anomalies(
     fig: go.Figure,
     time_series: pd.DataFrame,
     is_anomaly: np.ndarray,
-    expected_values: np.array,
-    expected_bounds: np.array,
+    expected_values: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
 ):
-    time_series = time_series.copy()
-    time_series["expected"] = expected_values
-    time_series["upper"] = expected_bounds[:, 0]
-    time_series["lower"] = expected_bounds[:, 1]
-    anomaly_points = time_series[is_anomaly == 1]
-    fig = add_points(
-        fig, anomaly_points.index, anomaly_points["value_0"], "Anomalies", "red"
-    )
-    fig = add_confidence_interval(fig, time_series)
-    return fig
+    # Same rule as the matplotlib backend: a point is an anomaly if flagged 1
+    mask = np.asarray(is_anomaly) == 1
+    # Keep the index type, .values would drop the timezone the line keeps
+    anomaly_x = time_series.index[mask]
+    if pd.api.types.is_datetime64_dtype(anomaly_x):
+        # Typed NumPy arrays take plotly's fast serialization path
+        anomaly_x = anomaly_x.to_numpy(dtype="datetime64[ms]")
+    # Cast after masking so it only touches the anomalies
+    anomaly_y = time_series["value_0"].to_numpy()[mask]
+    anomaly_y = anomaly_y.astype(np.float64, copy=False)
+    forecast = forecast_frame(time_series.index, expected_values, upper, lower)
+    points = _points_trace(anomaly_x, anomaly_y, "Anomalies", "red")
+    return _add_traces_with_forecast(fig, forecast, traces=[points])